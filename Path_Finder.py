@@ -1,30 +1,130 @@
 """Fast Universal Tessdata Path Finder for all operating systems."""
 import os
-import shutil
-import subprocess
+import functools
+import json
 import platform
+import queue
+import re
 import sys
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 import threading
 import time
 
-try:
-    import winreg
-except ImportError:
-    winreg = None
+# subprocess, concurrent.futures and winreg are imported where they are used,
+# so importing the module or answering from the cache never pays for them
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Path-like tokens mentioning tessdata in `tesseract --print-parameters` output
+TESSDATA_RE = re.compile(r'(/[^\s"\']*tessdata[^\s"\']*|[A-Z]:[\\/][^\s"\']*tessdata[^\s"\']*)', re.I)
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'tessdata_finder.json')
+
+# Skip system/uninteresting directories (all entries lowercase)
+_SKIP_DIRS = frozenset({
+    'windows', 'system32', 'syswow64', '$recycle.bin', 'recovery',
+    'proc', 'sys', 'dev', 'run', 'tmp', 'var/tmp', 'boot',
+    '.git', '.svn', '__pycache__', 'node_modules', '.vscode'
+})
+
+# Focus on directories likely to contain tesseract (all entries lowercase)
+_KEYWORDS = frozenset({
+    'tesseract', 'ocr', 'program', 'share', 'local', 'opt', 'tools', 'bin'
+})
+_KEYWORDS_RE = re.compile('|'.join(sorted(_KEYWORDS)))
+
+# Any digit hints at a versioned install when ranking paths
+_DIGIT_RE = re.compile(r'\d')
+
+# GetDriveTypeW return value for local, non-removable disks
+DRIVE_FIXED = 3
+
+@functools.lru_cache(maxsize=256)
+def _expand_path(path_template: str) -> str:
+    """Expand ~ and environment variables in a path template into an absolute path."""
+    return os.path.abspath(os.path.expandvars(os.path.expanduser(path_template)))
+
 
 class TessdataFinder:
     """Fast, robust tessdata directory finder for all operating systems."""
     
-    def __init__(self, timeout: float = 10.0, max_workers: int = 4):
+    # Environment variables that may point at tessdata
+    _ENV_VARS = ('TESSDATA_PREFIX', 'TESSERACT_DATA_PATH', 'TESSERACT_PREFIX')
+    
+    # Possible relative paths from binary to tessdata
+    _WINDOWS_RELATIVE_TESSDATA_PATHS = (
+        'tessdata',
+        '../tessdata', 
+        '../../tessdata',
+        '../share/tessdata',
+        '../share/tesseract-ocr/tessdata'
+    )
+    _UNIX_RELATIVE_TESSDATA_PATHS = (
+        '../share/tesseract-ocr/tessdata',
+        '../share/tesseract/tessdata',
+        '../share/tessdata',
+        '../../share/tesseract-ocr/tessdata',
+        '../../share/tesseract/tessdata',
+        '../tessdata',
+        'tessdata'
+    )
+    
+    # Common tessdata installation paths by OS
+    _WINDOWS_TESSDATA_PATHS = (
+        "C:/Program Files/Tesseract-OCR/tessdata",
+        "C:/Program Files (x86)/Tesseract-OCR/tessdata", 
+        "C:/Tesseract-OCR/tessdata",
+        "C:/tools/tesseract/tessdata",
+        "${LOCALAPPDATA}/Tesseract-OCR/tessdata",
+        "${PROGRAMFILES}/Tesseract-OCR/tessdata",
+        "${PROGRAMFILES(X86)}/Tesseract-OCR/tessdata",
+        "~/AppData/Local/Tesseract-OCR/tessdata",
+        "~/tessdata"
+    )
+    _MACOS_TESSDATA_PATHS = (
+        "/usr/local/share/tesseract-ocr/tessdata",
+        "/usr/local/share/tessdata", 
+        "/opt/homebrew/share/tesseract-ocr/tessdata",
+        "/usr/share/tesseract-ocr/tessdata",
+        "~/.local/share/tesseract/tessdata",
+        "~/tessdata"
+    )
+    _LINUX_TESSDATA_PATHS = (
+        "/usr/share/tesseract-ocr/tessdata",
+        "/usr/share/tessdata",
+        "/usr/local/share/tesseract-ocr/tessdata", 
+        "/usr/local/share/tessdata",
+        "/opt/tesseract/share/tessdata",
+        "~/.local/share/tesseract/tessdata",
+        "~/.tesseract/tessdata",
+        "~/tessdata"
+    )
+    
+    # Common binary paths by OS
+    _WINDOWS_BINARY_PATHS = (
+        "C:/Program Files/Tesseract-OCR/tesseract.exe",
+        "C:/Program Files (x86)/Tesseract-OCR/tesseract.exe",
+        "C:/tools/tesseract/tesseract.exe"
+    )
+    _UNIX_BINARY_PATHS = (
+        "/usr/bin/tesseract",
+        "/usr/local/bin/tesseract",
+        "/opt/tesseract/bin/tesseract"
+    )
+    
+    def __init__(self, timeout: float = 10.0, max_workers: int = 4,
+                 cache_ttl: float = 24 * 3600, cache_file: str = CACHE_FILE,
+                 target_count: int = 3):
         """
         Initialize the tessdata finder.
         
         Args:
             timeout: Maximum time to spend searching (seconds)
             max_workers: Maximum number of concurrent search threads
+            cache_ttl: Maximum age of cached results (seconds), 0 disables caching
+            cache_file: Location of the persistent results cache
+            target_count: Stop walking the filesystem once this many tessdata
+                directories are known, 0 walks everything
         """
         self.timeout = timeout
         self.max_workers = max_workers
@@ -32,19 +132,50 @@ class TessdataFinder:
         self.found_paths: Set[str] = set()
         self.lock = threading.Lock()
         self.os_type = platform.system().lower()
-        
-    def find_all_tessdata_paths(self, verbose: bool = False) -> List[str]:
+        self.max_depth = 4 if self.os_type == 'windows' else 5
+        self.target_count = target_count
+        self._done = threading.Event()
+        self._valid_cache: Dict[str, bool] = {}
+        self._abspath_cache: Dict[str, str] = {}
+        self._binary_info_cache: Dict[str, str] = {}
+        self._executors: Dict[str, 'ThreadPoolExecutor'] = {}
+        self.cache_ttl = cache_ttl
+        self.cache_file = cache_file
+        self.cache_key = f"{self.os_type}:{platform.node()}"
+        self._cached_entry = self._load_cache()
+        
+    def find_all_tessdata_paths(self, verbose: bool = False, force_refresh: bool = False,
+                                stop_on_first: bool = False) -> List[str]:
         """
         Find all tessdata directory paths on the system.
         
         Args:
             verbose: If True, prints search progress
+            force_refresh: If True, ignores cached results and searches again
+            stop_on_first: If True, returns as soon as a high-priority method finds a path
             
         Returns:
             List of tessdata directory paths, ordered by priority
         """
         self.start_time = time.time()
         self.found_paths.clear()
+        self._done.clear()
+        self._valid_cache.clear()
+        self._abspath_cache.clear()
+        
+        # Results of a stop_on_first search only satisfy other stop_on_first searches,
+        # and none are trusted once they outlive the TTL (checked on every call, as a
+        # finder may be long-lived) or the environment that produced them has changed
+        if (not force_refresh and self._cached_entry
+                and self._is_cache_fresh(self._cached_entry)
+                and (stop_on_first or self._cached_entry.get('complete', True))
+                and self._cached_entry.get('environment') == self._environment_fingerprint()):
+            cached = self._cached_entry['paths']
+            mtimes = self._cached_entry.get('mtimes', {})
+            if all(self._is_cached_path_live(path, mtimes.get(path)) for path in cached):
+                if verbose:
+                    print(f"Using {len(cached)} cached tessdata paths")
+                return list(cached)
         
         if verbose:
             print(f"Searching for tessdata paths on {self.os_type}...")
@@ -58,37 +189,24 @@ class TessdataFinder:
             self._search_filesystem_smart,
         ]
         
-        # Execute high-priority methods first (sequentially)
-        for method in search_methods[:3]:
-            if self._is_timeout():
-                break
-            try:
-                paths = method(verbose)
-                with self.lock:
-                    self.found_paths.update(paths)
-            except Exception as e:
-                if verbose:
-                    print(f"Warning: {method.__name__} failed: {e}")
+        # The probes are independent and I/O-bound, so run them concurrently. When
+        # stopping on the first hit, hold back the expensive ones until the cheap
+        # high-priority probes have all come up empty, and accept hits in priority order.
+        executor = self._get_executor()
+        first_batch = search_methods[:3] if stop_on_first else search_methods
+        futures = {executor.submit(method, verbose): method.__name__ for method in first_batch}
+        stopped_early = self._collect_results(futures, verbose, stop_on_first)
         
-        # Execute remaining methods concurrently
-        if not self._is_timeout() and len(search_methods) > 3:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(method, verbose): method.__name__ 
-                          for method in search_methods[3:]}
-                
-                for future in as_completed(futures, timeout=max(1, self.timeout - self._elapsed())):
-                    if self._is_timeout():
-                        break
-                    try:
-                        paths = future.result(timeout=1)
-                        with self.lock:
-                            self.found_paths.update(paths)
-                    except Exception as e:
-                        if verbose:
-                            print(f"Warning: {futures[future]} failed: {e}")
+        if stop_on_first and not stopped_early and not self._is_timeout():
+            futures = {executor.submit(method, verbose): method.__name__
+                       for method in search_methods[3:]}
+            self._collect_results(futures, verbose)
         
         # Sort by priority and filter valid paths
         result = self._prioritize_paths(list(self.found_paths))
+        # A search cut short by stop_on_first, the timeout or target_count may have missed paths
+        complete = not stopped_early and not self._is_timeout() and not self._done.is_set()
+        self._save_cache(result, complete=complete)
         
         if verbose:
             print(f"Found {len(result)} tessdata paths in {self._elapsed():.2f}s")
@@ -105,25 +223,189 @@ class TessdataFinder:
         Returns:
             Primary tessdata path, None if not found
         """
-        paths = self.find_all_tessdata_paths(verbose)
+        paths = self.find_all_tessdata_paths(verbose, stop_on_first=True)
         return paths[0] if paths else None
     
+    def _collect_results(self, futures: Dict['Future', str], verbose: bool = False,
+                         stop_on_first: bool = False) -> bool:
+        """
+        Merge search results into found_paths as the futures complete.
+        
+        With stop_on_first, futures are read in submission (priority) order, so a
+        hit is only accepted once every higher-priority probe has come up empty.
+        If the deadline passes first, whatever has already finished is still kept.
+        
+        Returns:
+            True if collection stopped at the first result (stop_on_first)
+        """
+        from concurrent.futures import TimeoutError as FuturesTimeoutError, as_completed
+        
+        merged = set()
+        try:
+            if stop_on_first:
+                ordered = iter(futures)
+            else:
+                ordered = as_completed(futures, timeout=max(0, self.timeout - self._elapsed()))
+            for future in ordered:
+                if self._is_timeout():
+                    break
+                try:
+                    # as_completed yields finished futures; in priority order we
+                    # wait at most for what is left of the overall timeout
+                    future.result(timeout=max(0, self.timeout - self._elapsed()))
+                except FuturesTimeoutError:
+                    break
+                except Exception:
+                    pass
+                self._merge_result(future, futures, verbose)
+                merged.add(future)
+                if stop_on_first and self.found_paths:
+                    return True
+        except FuturesTimeoutError:
+            pass
+        
+        if stop_on_first:
+            # Timed out waiting on a higher-priority probe: fall back to the
+            # lower-priority ones that already finished, still in priority order
+            for future in futures:
+                if future.done() and future not in merged:
+                    self._merge_result(future, futures, verbose)
+                    if self.found_paths:
+                        return True
+        return False
+    
+    def _merge_result(self, future: 'Future', futures: Dict['Future', str], verbose: bool = False):
+        """Add the paths of a finished search future to found_paths."""
+        try:
+            paths = future.result()
+            with self.lock:
+                self.found_paths.update(self._abspath(path) for path in paths)
+                # Lets a filesystem walk that is already running stop early too
+                self._check_target_count([])
+        except Exception as e:
+            if verbose:
+                print(f"Warning: {futures[future]} failed: {e}")
+    
+    def close(self):
+        """Shut down the worker threads kept alive between searches."""
+        with self.lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False)
+    
+    def _get_executor(self, name: str = 'search') -> 'ThreadPoolExecutor':
+        """
+        Get a named shared thread pool, creating it on first use.
+        
+        Search methods run on the 'search' pool; candidate validation, which
+        those methods wait on, uses the separate 'probe' pool so it can never
+        be starved by them.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with self.lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = self._executors[name] = ThreadPoolExecutor(max_workers=self.max_workers)
+            return executor
+    
+    def _load_cache(self) -> Optional[dict]:
+        """Load this host's cache entry if it is younger than the TTL."""
+        if self.cache_ttl <= 0:
+            return None
+        try:
+            with open(self.cache_file, 'r') as f:
+                entry = json.load(f).get(self.cache_key)
+            if not entry or not entry.get('paths'):
+                return None
+            return entry if self._is_cache_fresh(entry) else None
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def _is_cache_fresh(self, entry: dict) -> bool:
+        """Check if a cache entry is still younger than the TTL."""
+        return time.time() - entry.get('timestamp', 0) <= self.cache_ttl
+    
+    def _save_cache(self, paths: List[str], complete: bool = True):
+        """Atomically store found paths in the cache file under this host's key."""
+        if self.cache_ttl <= 0 or not paths:
+            return
+        import tempfile
+        
+        tmp_file = None
+        try:
+            try:
+                with open(self.cache_file, 'r') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    data = {}
+            except (OSError, ValueError):
+                data = {}
+            
+            mtimes = {}
+            for path in paths:
+                try:
+                    mtimes[path] = os.stat(path).st_mtime
+                except OSError:
+                    continue
+            
+            entry = {'paths': paths, 'mtimes': mtimes, 'timestamp': time.time(),
+                     'complete': complete, 'environment': self._environment_fingerprint()}
+            data[self.cache_key] = entry
+            
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            # A unique temp file in the same directory keeps os.replace atomic and
+            # stops concurrent savers (threads or processes) clobbering each other
+            fd, tmp_file = tempfile.mkstemp(
+                dir=cache_dir or os.curdir,
+                prefix=os.path.basename(self.cache_file) + '.', suffix='.tmp'
+            )
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+            self._cached_entry = entry
+        except OSError:
+            if tmp_file:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+    
+    def _environment_fingerprint(self) -> Dict[str, Optional[str]]:
+        """Get the environment values that steer the search (tessdata vars and PATH)."""
+        return {var: os.environ.get(var) for var in self._ENV_VARS + ('PATH',)}
+    
+    def _is_cached_path_live(self, path: str, mtime: Optional[float]) -> bool:
+        """Check a cached path, trusting it without a rescan if its mtime is unchanged."""
+        try:
+            if mtime is not None and os.stat(path).st_mtime == mtime:
+                return True
+        except OSError:
+            return False
+        return self._is_valid_tessdata_dir(path)
+    
     def _check_environment_vars(self, verbose: bool = False) -> List[str]:
         """Check environment variables for tessdata paths."""
         paths = []
-        env_vars = ['TESSDATA_PREFIX', 'TESSERACT_DATA_PATH', 'TESSERACT_PREFIX']
-        
-        for var in env_vars:
+        # Handle both direct tessdata path and parent directory
+        candidates = []
+        for var in self._ENV_VARS:
             path = os.environ.get(var)
             if path:
-                # Handle both direct tessdata path and parent directory
-                candidates = [path, os.path.join(path, 'tessdata')]
-                for candidate in candidates:
-                    if self._is_valid_tessdata_dir(candidate):
-                        paths.append(os.path.abspath(candidate))
-                        if verbose:
-                            print(f"Found via ENV {var}: {candidate}")
-                        break
+                candidates.append((var, path))
+                candidates.append((var, os.path.join(path, 'tessdata')))
+        
+        found_vars = set()
+        valid = self._validate_candidates([candidate for _, candidate in candidates])
+        for (var, candidate), is_valid in zip(candidates, valid):
+            if is_valid and var not in found_vars:
+                found_vars.add(var)
+                paths.append(self._abspath(candidate))
+                if verbose:
+                    print(f"Found via ENV {var}: {candidate}")
         
         return paths
     
@@ -131,69 +413,70 @@ class TessdataFinder:
         """Get tessdata paths from tesseract binary information."""
         paths = []
         
-        # Find tesseract binaries
-        binaries = self._find_tesseract_binaries()
+        # Find tesseract binaries, collapsing symlinks/aliases to the same file
+        binaries = []
+        for binary in self._find_tesseract_binaries():
+            real_binary = os.path.realpath(binary)
+            if real_binary not in binaries:
+                binaries.append(real_binary)
+        
+        # Method 1: Relative to binary location (a few directory probes; binaries
+        # are already realpaths, so their directories need no further resolving)
+        candidates = [os.path.join(os.path.dirname(binary), rel_path)
+                      for binary in binaries
+                      for rel_path in self._get_relative_tessdata_paths()]
+        self._add_valid_candidates(paths, candidates, "binary location", verbose)
+        
+        # Method 2: Ask tesseract directly, only when the probes found nothing,
+        # since it costs a process spawn per binary
+        if not paths:
+            for binary in binaries:
+                if self._is_timeout():
+                    break
+                candidates = TESSDATA_RE.findall(self._get_binary_parameters(binary))
+                self._add_valid_candidates(paths, candidates, "tesseract info", verbose)
         
-        for binary in binaries:
-            if self._is_timeout():
-                break
-                
-            # Method 1: Ask tesseract directly
+        return paths
+    
+    def _add_valid_candidates(self, paths: List[str], candidates: List[str],
+                              source: str, verbose: bool = False):
+        """Append the valid, not yet seen candidates to paths."""
+        for candidate, is_valid in zip(candidates, self._validate_candidates(candidates)):
+            abs_path = self._abspath(candidate)
+            if is_valid and abs_path not in paths:
+                paths.append(abs_path)
+                if verbose:
+                    print(f"Found via {source}: {abs_path}")
+    
+    def _get_binary_parameters(self, binary: str) -> str:
+        """Get (and remember) the --print-parameters output of a tesseract binary."""
+        output = self._binary_info_cache.get(binary)
+        if output is None:
+            import subprocess
             try:
                 result = subprocess.run(
                     [binary, '--print-parameters'],
-                    capture_output=True, text=True, timeout=3
+                    capture_output=True, text=True, timeout=1
                 )
-                for line in result.stdout.split('\n'):
-                    if 'tessdata' in line.lower():
-                        # Extract path-like strings
-                        words = line.split()
-                        for word in words:
-                            if 'tessdata' in word and os.path.isdir(word):
-                                if self._is_valid_tessdata_dir(word):
-                                    paths.append(os.path.abspath(word))
-                                    if verbose:
-                                        print(f"Found via tesseract info: {word}")
+                output = result.stdout
             except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                pass
-            
-            # Method 2: Relative to binary location
-            try:
-                bin_dir = Path(binary).parent.resolve()
-                relative_paths = self._get_relative_tessdata_paths()
-                
-                for rel_path in relative_paths:
-                    candidate = bin_dir / rel_path
-                    if candidate.is_dir() and self._is_valid_tessdata_dir(str(candidate)):
-                        abs_path = str(candidate.resolve())
-                        if abs_path not in paths:
-                            paths.append(abs_path)
-                            if verbose:
-                                print(f"Found relative to binary: {abs_path}")
-            except Exception:
-                continue
-        
-        return paths
+                output = ''
+            self._binary_info_cache[binary] = output
+        return output
     
     def _check_common_locations(self, verbose: bool = False) -> List[str]:
         """Check common installation locations."""
         paths = []
-        common_paths = self._get_common_tessdata_paths()
-        
-        for path_template in common_paths:
-            if self._is_timeout():
-                break
-                
-            try:
-                # Expand environment variables and user paths
-                expanded_path = os.path.expandvars(os.path.expanduser(path_template))
-                if os.path.isdir(expanded_path) and self._is_valid_tessdata_dir(expanded_path):
-                    abs_path = os.path.abspath(expanded_path)
-                    paths.append(abs_path)
-                    if verbose:
-                        print(f"Found in common location: {abs_path}")
-            except Exception:
-                continue
+        # Expand environment variables and user paths
+        candidates = [_expand_path(path_template)
+                      for path_template in self._get_common_tessdata_paths()]
+        
+        for candidate, is_valid in zip(candidates, self._validate_candidates(candidates)):
+            if is_valid:
+                abs_path = self._abspath(candidate)
+                paths.append(abs_path)
+                if verbose:
+                    print(f"Found in common location: {abs_path}")
         
         return paths
     
@@ -201,7 +484,11 @@ class TessdataFinder:
         """Check Windows registry for tessdata paths."""
         paths = []
         
-        if not winreg or self.os_type != 'windows':
+        if self.os_type != 'windows':
+            return paths
+        try:
+            import winreg
+        except ImportError:
             return paths
         
         registry_locations = [
@@ -210,18 +497,21 @@ class TessdataFinder:
             (winreg.HKEY_CURRENT_USER, "SOFTWARE\\Tesseract-OCR"),
         ]
         
+        candidates = []
         for hkey, subkey in registry_locations:
             try:
                 with winreg.OpenKey(hkey, subkey) as key:
                     install_path, _ = winreg.QueryValueEx(key, "InstallPath")
-                    tessdata_path = os.path.join(install_path, "tessdata")
-                    if self._is_valid_tessdata_dir(tessdata_path):
-                        paths.append(os.path.abspath(tessdata_path))
-                        if verbose:
-                            print(f"Found via registry: {tessdata_path}")
+                    candidates.append(os.path.join(install_path, "tessdata"))
             except (FileNotFoundError, OSError, PermissionError):
                 continue
         
+        for tessdata_path, is_valid in zip(candidates, self._validate_candidates(candidates)):
+            if is_valid:
+                paths.append(self._abspath(tessdata_path))
+                if verbose:
+                    print(f"Found via registry: {tessdata_path}")
+        
         return paths
     
     def _search_filesystem_smart(self, verbose: bool = False) -> List[str]:
@@ -231,171 +521,198 @@ class TessdataFinder:
         if self._is_timeout():
             return paths
         
+        # The other methods may already have found enough
+        with self.lock:
+            self._check_target_count([])
+        if self._should_stop():
+            return paths
+        
         search_roots = self._get_search_roots()
+        if not search_roots:
+            return paths
         
-        with ThreadPoolExecutor(max_workers=min(len(search_roots), self.max_workers)) as executor:
-            futures = {
-                executor.submit(self._search_directory_tree, root, verbose): root
-                for root in search_roots
-            }
-            
-            for future in as_completed(futures, timeout=max(1, self.timeout - self._elapsed())):
-                if self._is_timeout():
-                    break
+        self._prefetch_directories(search_roots)
+        if len(search_roots) == 1:
+            return self._search_directory_tree(search_roots[0], verbose)
+        
+        # Breadth-first walk over a shared queue so every worker stays busy,
+        # regardless of how many roots there are or how unbalanced they are
+        tasks: queue.Queue = queue.Queue()
+        visited = set(search_roots)
+        pending = len(search_roots)
+        done = threading.Event()
+        for root in search_roots:
+            tasks.put((root, 0))
+        
+        def _worker():
+            nonlocal pending
+            while not done.is_set() and not self._should_stop():
                 try:
-                    found_paths = future.result(timeout=1)
-                    paths.extend(found_paths)
-                except Exception:
+                    current_path, depth = tasks.get(timeout=0.05)
+                except queue.Empty:
                     continue
-        
-        return paths
+                
+                found, subdirs = self._scan_directory(current_path, verbose)
+                if depth + 1 >= self.max_depth:
+                    subdirs = []
+                
+                with self.lock:
+                    if found:
+                        paths.extend(found)
+                        self._check_target_count(paths)
+                    subdirs = [d for d in subdirs if d not in visited]
+                    visited.update(subdirs)
+                    pending += len(subdirs) - 1
+                    if pending == 0:
+                        done.set()
+                
+                for subdir in subdirs:
+                    tasks.put((subdir, depth + 1))
+        
+        # The calling thread works the queue too, so progress never depends on
+        # a free slot in the shared executor (which may be running this method)
+        executor = self._get_executor()
+        for _ in range(self.max_workers - 1):
+            executor.submit(_worker)
+        _worker()
+        done.set()
+        
+        with self.lock:
+            return list(paths)
+    
+    def _prefetch_directories(self, directories: List[str]):
+        """Hint the kernel to start reading directories we are about to walk (best effort)."""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        flags = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+        for directory in directories:
+            try:
+                fd = os.open(directory, flags)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
     
     def _search_directory_tree(self, root_path: str, verbose: bool = False) -> List[str]:
         """Search directory tree for tessdata folders."""
         found = []
-        max_depth = 4 if self.os_type == 'windows' else 5
+        root_depth = root_path.rstrip(os.sep).count(os.sep)
         
-        def _recursive_search(current_path: Path, depth: int):
-            if depth > max_depth or self._is_timeout():
-                return
-            
-            try:
-                if current_path.name == 'tessdata' and self._is_valid_tessdata_dir(str(current_path)):
-                    abs_path = str(current_path.resolve())
-                    found.append(abs_path)
-                    if verbose:
-                        print(f"Found via filesystem search: {abs_path}")
-                    return
-                
-                # Only search relevant subdirectories
-                if self._should_search_directory(current_path):
-                    for child in current_path.iterdir():
-                        if child.is_dir() and not child.is_symlink():
-                            _recursive_search(child, depth + 1)
-                        
-            except (PermissionError, OSError, FileNotFoundError):
-                pass
+        with self.lock:
+            self._check_target_count(found)
+        if self._should_stop():
+            return found
         
         try:
-            _recursive_search(Path(root_path), 0)
+            # topdown walk lets us prune whole subtrees by editing dirs in place
+            for dirpath, dirs, _ in os.walk(root_path, topdown=True, followlinks=False):
+                if self._should_stop():
+                    break
+                
+                depth = 0 if dirpath == root_path else dirpath.count(os.sep) - root_depth
+                
+                if 'tessdata' in dirs:
+                    dirs.remove('tessdata')
+                    tessdata_path = os.path.join(dirpath, 'tessdata')
+                    # os.walk lists symlinked dirs too; skip them like _scan_directory does
+                    if (not os.path.islink(tessdata_path)
+                            and self._is_valid_tessdata_dir(tessdata_path)):
+                        abs_path = self._abspath(tessdata_path)
+                        found.append(abs_path)
+                        if verbose:
+                            print(f"Found via filesystem search: {abs_path}")
+                        with self.lock:
+                            self._check_target_count(found)
+                
+                if depth + 1 >= self.max_depth:
+                    dirs[:] = []
+                else:
+                    dirs[:] = [d for d in dirs if self._should_search_directory(d)]
         except Exception:
             pass
         
         return found
     
+    def _scan_directory(self, path: str, verbose: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        List a single directory during the filesystem search.
+        
+        Returns:
+            Tuple of (valid tessdata children, subdirectories worth descending into)
+        """
+        found = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # d_type answers this without a stat on most filesystems
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == 'tessdata':
+                        if self._is_valid_tessdata_dir(entry.path):
+                            abs_path = self._abspath(entry.path)
+                            found.append(abs_path)
+                            if verbose:
+                                print(f"Found via filesystem search: {abs_path}")
+                    # Only descend into relevant subdirectories
+                    elif self._should_search_directory(entry.name):
+                        subdirs.append(entry.path)
+        except (PermissionError, OSError):
+            pass
+        
+        return found, subdirs
+    
     def _find_tesseract_binaries(self) -> List[str]:
         """Find tesseract binary locations."""
         binaries = []
+        seen = set()
         
-        # Method 1: Use shutil.which (most reliable)
-        for name in ['tesseract', 'tesseract.exe']:
-            binary = shutil.which(name)
-            if binary and binary not in binaries:
-                binaries.append(binary)
+        # PATH entries first (same order shutil.which would use), then common locations
+        candidates = [
+            os.path.join(path_dir, name)
+            for path_dir in os.environ.get('PATH', '').split(os.pathsep) if path_dir
+            for name in ('tesseract', 'tesseract.exe')
+        ]
+        candidates.extend(_expand_path(path) for path in self._get_common_binary_paths())
         
-        # Method 2: Check PATH explicitly
-        path_env = os.environ.get('PATH', '')
-        for path_dir in path_env.split(os.pathsep):
-            if not path_dir:
+        for candidate in candidates:
+            if candidate in seen:
                 continue
-            for name in ['tesseract', 'tesseract.exe']:
-                binary_path = os.path.join(path_dir, name)
-                if (os.path.isfile(binary_path) and 
-                    os.access(binary_path, os.X_OK) and 
-                    binary_path not in binaries):
-                    binaries.append(binary_path)
-        
-        # Method 3: Common locations
-        common_binary_paths = self._get_common_binary_paths()
-        for path in common_binary_paths:
-            expanded = os.path.expandvars(os.path.expanduser(path))
-            if (os.path.isfile(expanded) and 
-                os.access(expanded, os.X_OK) and 
-                expanded not in binaries):
-                binaries.append(expanded)
+            seen.add(candidate)
+            # os.access fails fast for the (usual) missing file; isfile only runs on hits
+            if os.access(candidate, os.X_OK) and os.path.isfile(candidate):
+                binaries.append(candidate)
         
         return binaries
     
-    def _get_relative_tessdata_paths(self) -> List[str]:
+    def _get_relative_tessdata_paths(self) -> Tuple[str, ...]:
         """Get possible relative paths from binary to tessdata."""
         if self.os_type == 'windows':
-            return [
-                'tessdata',
-                '../tessdata', 
-                '../../tessdata',
-                '../share/tessdata',
-                '../share/tesseract-ocr/tessdata'
-            ]
-        else:
-            return [
-                '../share/tesseract-ocr/tessdata',
-                '../share/tesseract/tessdata',
-                '../share/tessdata',
-                '../../share/tesseract-ocr/tessdata',
-                '../../share/tesseract/tessdata',
-                '../tessdata',
-                'tessdata'
-            ]
-    
-    def _get_common_tessdata_paths(self) -> List[str]:
+            return self._WINDOWS_RELATIVE_TESSDATA_PATHS
+        return self._UNIX_RELATIVE_TESSDATA_PATHS
+    
+    def _get_common_tessdata_paths(self) -> Tuple[str, ...]:
         """Get common tessdata installation paths by OS."""
         if self.os_type == 'windows':
-            return [
-                "C:/Program Files/Tesseract-OCR/tessdata",
-                "C:/Program Files (x86)/Tesseract-OCR/tessdata", 
-                "C:/Tesseract-OCR/tessdata",
-                "C:/tools/tesseract/tessdata",
-                "${LOCALAPPDATA}/Tesseract-OCR/tessdata",
-                "${PROGRAMFILES}/Tesseract-OCR/tessdata",
-                "${PROGRAMFILES(X86)}/Tesseract-OCR/tessdata",
-                "~/AppData/Local/Tesseract-OCR/tessdata",
-                "~/tessdata"
-            ]
+            return self._WINDOWS_TESSDATA_PATHS
         elif self.os_type == 'darwin':  # macOS
-            return [
-                "/usr/local/share/tesseract-ocr/tessdata",
-                "/usr/local/share/tessdata", 
-                "/opt/homebrew/share/tesseract-ocr/tessdata",
-                "/usr/share/tesseract-ocr/tessdata",
-                "~/.local/share/tesseract/tessdata",
-                "~/tessdata"
-            ]
-        else:  # Linux and others
-            return [
-                "/usr/share/tesseract-ocr/tessdata",
-                "/usr/share/tessdata",
-                "/usr/local/share/tesseract-ocr/tessdata", 
-                "/usr/local/share/tessdata",
-                "/opt/tesseract/share/tessdata",
-                "~/.local/share/tesseract/tessdata",
-                "~/.tesseract/tessdata",
-                "~/tessdata"
-            ]
-    
-    def _get_common_binary_paths(self) -> List[str]:
+            return self._MACOS_TESSDATA_PATHS
+        return self._LINUX_TESSDATA_PATHS  # Linux and others
+    
+    def _get_common_binary_paths(self) -> Tuple[str, ...]:
         """Get common binary paths by OS."""
         if self.os_type == 'windows':
-            return [
-                "C:/Program Files/Tesseract-OCR/tesseract.exe",
-                "C:/Program Files (x86)/Tesseract-OCR/tesseract.exe",
-                "C:/tools/tesseract/tesseract.exe"
-            ]
-        else:
-            return [
-                "/usr/bin/tesseract",
-                "/usr/local/bin/tesseract",
-                "/opt/tesseract/bin/tesseract"
-            ]
+            return self._WINDOWS_BINARY_PATHS
+        return self._UNIX_BINARY_PATHS
     
     def _get_search_roots(self) -> List[str]:
         """Get filesystem search root directories."""
         if self.os_type == 'windows':
-            # Get available drives
-            drives = []
-            for letter in 'CDEFGHIJKLMNOPQRSTUVWXYZ':
-                drive = f"{letter}:\\"
-                if os.path.exists(drive):
-                    drives.append(drive)
+            drives = self._get_fixed_drives()
             
             roots = []
             for drive in drives[:2]:  # Limit to first 2 drives for speed
@@ -407,72 +724,117 @@ class TessdataFinder:
         else:
             return ["/usr", "/usr/local", "/opt"]
     
-    def _should_search_directory(self, path: Path) -> bool:
-        """Determine if directory should be searched."""
-        name = path.name.lower()
-        
-        # Skip system/uninteresting directories
-        skip_dirs = {
-            'windows', 'system32', 'syswow64', '$recycle.bin', 'recovery',
-            'proc', 'sys', 'dev', 'run', 'tmp', 'var/tmp', 'boot',
-            '.git', '.svn', '__pycache__', 'node_modules', '.vscode'
-        }
+    def _get_fixed_drives(self) -> List[str]:
+        """Get local fixed drive roots on Windows."""
+        letters = 'CDEFGHIJKLMNOPQRSTUVWXYZ'
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            # One bitmask call instead of probing every letter, which can wake
+            # sleeping network/removable drives
+            mask = kernel32.GetLogicalDrives()
+            drives = [f"{letter}:\\" for letter in letters
+                      if mask & (1 << (ord(letter) - ord('A')))]
+            return [drive for drive in drives
+                    if kernel32.GetDriveTypeW(drive) == DRIVE_FIXED]
+        except (ImportError, AttributeError, OSError):
+            return [f"{letter}:\\" for letter in letters if os.path.exists(f"{letter}:\\")]
+    
+    def _should_search_directory(self, name: str) -> bool:
+        """Determine if directory with the given name should be searched."""
+        name = name.lower()
         
-        if name in skip_dirs:
+        if name in _SKIP_DIRS:
             return False
         
-        # Focus on directories likely to contain tesseract
-        interesting_keywords = {
-            'tesseract', 'ocr', 'program', 'share', 'local', 'opt', 'tools', 'bin'
-        }
-        
-        return any(keyword in name for keyword in interesting_keywords) or len(name) < 3
+        return len(name) < 3 or _KEYWORDS_RE.search(name) is not None
     
     def _is_valid_tessdata_dir(self, path: str) -> bool:
         """Check if directory contains tessdata files."""
+        key = self._abspath(path)
+        cached = self._valid_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Look for .traineddata files, stopping at the first match. A plain
+        # scandir loop beats both os.listdir (lists everything up front) and
+        # glob.iglob (also lists everything, then regex-matches each name).
+        valid = False
         try:
-            path_obj = Path(path)
-            if not path_obj.is_dir():
-                return False
-            
-            # Look for .traineddata files
-            has_traineddata = any(f.suffix == '.traineddata' for f in path_obj.iterdir())
-            return has_traineddata
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.traineddata'):
+                        valid = True
+                        break
         except (OSError, PermissionError):
-            return False
+            valid = False
+        
+        self._valid_cache[key] = valid
+        return valid
+    
+    def _validate_candidates(self, candidates: List[str]) -> List[bool]:
+        """
+        Validate candidate tessdata directories, probing uncached ones concurrently.
+        
+        Returns:
+            One validity flag per candidate, in the same order
+        """
+        pending = list(dict.fromkeys(
+            key for key in map(self._abspath, candidates) if key not in self._valid_cache
+        ))
+        if len(pending) > 1:
+            # Results land in _valid_cache; the lookups below are then free
+            list(self._get_executor('probe').map(self._is_valid_tessdata_dir, pending))
+        return [self._is_valid_tessdata_dir(candidate) for candidate in candidates]
+    
+    def _abspath(self, path: str) -> str:
+        """Memoized os.path.abspath (which also normalizes the path)."""
+        cached = self._abspath_cache.get(path)
+        if cached is None:
+            cached = self._abspath_cache[path] = os.path.abspath(path)
+        return cached
     
     def _prioritize_paths(self, paths: List[str]) -> List[str]:
         """Sort paths by priority/preference."""
-        def priority_key(path: str) -> tuple:
-            path_lower = path.lower()
+        # Normalize, dedupe and score in a single pass
+        seen = set()
+        ranked = []
+        for path in paths:
+            normalized = os.path.normpath(path)
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+            path_lower = normalized.lower()
             
             # Higher priority (lower number) for:
             priority = 0
             
             # Environment variable paths
-            if any(env in path_lower for env in ['tessdata_prefix', 'tesseract']):
+            if 'tessdata_prefix' in path_lower or 'tesseract' in path_lower:
                 priority -= 1000
             
             # Standard system locations
-            if any(sys_path in path_lower for sys_path in ['/usr/share', '/usr/local/share', 'program files']):
+            if ('/usr/share' in path_lower or '/usr/local/share' in path_lower
+                    or 'program files' in path_lower):
                 priority -= 100
                 
             # Prefer paths with version info (usually more recent)
-            if any(char.isdigit() for char in path):
+            if _DIGIT_RE.search(normalized):
                 priority -= 10
-                
-            return (priority, path_lower)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_paths = []
-        for path in paths:
-            normalized = os.path.normpath(path)
-            if normalized not in seen:
-                seen.add(normalized)
-                unique_paths.append(normalized)
+            
+            ranked.append((priority, path_lower, normalized))
         
-        return sorted(unique_paths, key=priority_key)
+        ranked.sort()
+        return [normalized for _, _, normalized in ranked]
+    
+    def _check_target_count(self, walk_found: List[str]):
+        """Signal walkers to stop once enough distinct paths are known (call with lock held)."""
+        if self.target_count and len(self.found_paths.union(walk_found)) >= self.target_count:
+            self._done.set()
+    
+    def _should_stop(self) -> bool:
+        """Check if the filesystem walk should end early."""
+        return self._done.is_set() or self._is_timeout()
     
     def _elapsed(self) -> float:
         """Get elapsed time since search started."""